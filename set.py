@@ -1,65 +1,173 @@
+import functools
+
+import numpy as np
 import streamlit as st
 
-# Gracefully handle the case where graphviz is not installed
-try:
-    import graphviz
-    GRAPHVIZ_INSTALLED = True
-except ImportError:
-    GRAPHVIZ_INSTALLED = False
-
-def display_graphviz_installation_instructions():
-    """Displays a formatted, user-friendly message for installing Graphviz."""
-    with st.container(border=True):
-        st.error("🎨 Graph Visualization Disabled", icon="🎨")
-        st.write("To enable the interactive graph visualizations, the `graphviz` library is required. Please follow the steps below:")
-        st.markdown("""
-            **Step 1: Install the Python Package**
-            
-            Open your terminal or command prompt and run this command:
-        """)
-        st.code("pip install graphviz streamlit", language="bash")
-        st.markdown("""
-            ---
-            **Step 2: Install the Graphviz System Software**
-
-            The Python package needs the underlying Graphviz software to function. You must install it for your operating system.
-            
-            ➡️ [**Click here to go to the official Graphviz download page**](https://graphviz.org/download/)
-            
-            *After installing, you may need to restart your terminal or computer. Then, restart the Streamlit app.*
-        """)
+@functools.lru_cache(maxsize=None)
+def _gv():
+    """Imports graphviz on first use, returning None if it is not installed."""
+    # Deferred so that sections without graphs don't pay for the import on cold start
+    try:
+        import graphviz
+        return graphviz
+    except ImportError:
+        return None
+
+def _svg_markup(svg):
+    """Drops the XML prolog from an SVG document; st.image only recognises SVG markup by its leading <svg> tag."""
+    return svg[svg.index('<svg'):]
+
+# Simplified MST from the paper's car example, sorted by descending weight so a
+# threshold splits it into kept and cut edges with a single binary search
+_PFMST_EDGES = [
+    ('G9', 'G4'), ('G7', 'G2'), ('G6', 'G1'),
+    ('G7', 'G3'), ('G10', 'G5'), ('G7', 'G8'),
+    ('G8', 'G10'), ('G3', 'G9'), ('G1', 'G4'),
+]
+_PFMST_W = np.array([0.87, 0.83, 0.82, 0.81, 0.76, 0.74, 0.69, 0.64, 0.64])
+_PFMST_LABELS = [f"{w:.2f}" for w in _PFMST_W]
+
+_FUZZY_DOT_TMPL = """graph {{
+	node [shape=circle style=filled fillcolor=lightblue fontcolor=black]
+	edge [fontcolor=darkgreen]
+	A [label="A (σ={sa:.2f})"]
+	B [label="B (σ={sb:.2f})"]
+	C [label="C (σ={sc:.2f})"]
+	A -- B [label="μ={ab:.2f}"]
+	B -- C [label="μ={bc:.2f}"]
+	A -- C [label="μ={ac:.2f}"]
+}}"""
+
+def _round_to_step(value, step=0.05):
+    """Snaps a slider value onto its step grid so equal settings share a cache entry."""
+    return round(round(value / step) * step, 2)
+
+@st.cache_data(max_entries=64)
+def _fuzzy_demo_dot(sa, sb, sc, ab, bc, ac):
+    """Returns the DOT source of the 'Build Your Own Fuzzy Graph' demo."""
+    return _FUZZY_DOT_TMPL.format(sa=sa, sb=sb, sc=sc, ab=ab, bc=bc, ac=ac)
+
+@st.cache_data
+def _build_mst(threshold):
+    """Returns the DOT source of the PFMST demo with edges below the threshold cut."""
+    lines = ['// Maximum Spanning Tree', 'graph {', '\tnode [shape=circle style=filled fillcolor=lightcoral]']
+
+    # Number of edges with weight >= threshold
+    cut = int(np.searchsorted(-_PFMST_W, -threshold, side='right'))
+    for (u, v), label in zip(_PFMST_EDGES[:cut], _PFMST_LABELS[:cut]):
+        lines.append(f'\t"{u}" -- "{v}" [label="{label}"]')
+    for u, v in _PFMST_EDGES[cut:]:
+        # To show they exist but are cut, we ensure the nodes are still present
+        lines.append(f'\t"{u}"; "{v}"')
+
+    lines.append('}')
+    return '\n'.join(lines)
+
+@st.cache_resource
+def _pfmst_svgs():
+    """Lays out the PFMST demo once for every threshold the slider can take (0.50-0.90 in 0.01 steps).
+
+    Returns a dict of SVG markup keyed by threshold, or an empty dict if the graphviz
+    package or its `dot` executable isn't available to lay the graphs out server-side.
+    """
+    gv = _gv()
+    if gv is None:
+        return {}
+    svgs = {}
+    for t in np.linspace(0.5, 0.9, 41):
+        key = round(float(t), 2)
+        try:
+            svg = gv.Source(_build_mst(key)).pipe(format='svg', encoding='utf-8')
+        except gv.ExecutableNotFound:
+            return {}
+        svgs[key] = _svg_markup(svg)
+    return svgs
+
+# Piecewise-linear membership function of the fuzzy set of 'Tall People'
+_TALL_X = np.array([140, 160, 180, 190, 220], dtype=np.float32)
+_TALL_Y = np.array([0.0, 0.0, 0.8, 1.0, 1.0], dtype=np.float32)
+
+@st.cache_data
+def _tall_membership_curve():
+    """Returns the full 'Tall People' membership curve for charting."""
+    heights = np.arange(140, 221)
+    return {"Height (cm)": heights, "Membership": np.interp(heights, _TALL_X, _TALL_Y)}
+
+@st.cache_data
+def _fuzzy_violations(sa, sb, sc, ab, bc, ac):
+    """Returns a message for each edge that breaks the golden rule μ(u, v) <= min(σ(u), σ(v))."""
+    violations = []
+    if ab > min(sa, sb):
+        violations.append(f"Edge A-B ({ab:.2f}) is stronger than min(A, B) = {min(sa, sb):.2f}")
+    if bc > min(sb, sc):
+        violations.append(f"Edge B-C ({bc:.2f}) is stronger than min(B, C) = {min(sb, sc):.2f}")
+    if ac > min(sa, sc):
+        violations.append(f"Edge A-C ({ac:.2f}) is stronger than min(A, C) = {min(sa, sc):.2f}")
+    return tuple(violations)
+
+@st.fragment
+def _render_fuzzy_graph_demo():
+    """Renders the 'Build Your Own Fuzzy Graph' demo; submitting its form only reruns this fragment."""
+    st.info("Interactive Demo: Build Your Own Fuzzy Graph!")
+    col1, col2 = st.columns([1, 1.5])
+    # The graph is only rebuilt when the form is submitted, not on every slider move
+    with col1, st.form("fuzzy_build"):
+        st.write("Adjust Vertex & Edge Values:")
+        sigma_a = st.slider("Vertex A Existence (σ)", 0.0, 1.0, 0.9, 0.05, key="sigma_a")
+        sigma_b = st.slider("Vertex B Existence (σ)", 0.0, 1.0, 0.8, 0.05, key="sigma_b")
+        sigma_c = st.slider("Vertex C Existence (σ)", 0.0, 1.0, 1.0, 0.05, key="sigma_c")
+        mu_ab = st.slider("Edge A-B Strength (μ)", 0.0, 1.0, 0.7, 0.05, key="mu_ab")
+        mu_bc = st.slider("Edge B-C Strength (μ)", 0.0, 1.0, 0.6, 0.05, key="mu_bc")
+        mu_ac = st.slider("Edge A-C Strength (μ)", 0.0, 1.0, 0.5, 0.05, key="mu_ac")
+        st.form_submit_button("Render")
+    
+    # Check the golden rule
+    violations = _fuzzy_violations(*(round(x, 2) for x in (sigma_a, sigma_b, sigma_c, mu_ab, mu_bc, mu_ac)))
+
+    with col2:
+        st.write("Generated Fuzzy Graph:")
+        # Reuse the last graph if the submitted values haven't changed
+        inputs = (sigma_a, sigma_b, sigma_c, mu_ab, mu_bc, mu_ac)
+        if "last_fuzzy_dot" in st.session_state and st.session_state.get("last_fuzzy_inputs") == inputs:
+            dot = st.session_state["last_fuzzy_dot"]
+        else:
+            dot = _fuzzy_demo_dot(*(_round_to_step(x) for x in inputs))
+            st.session_state["last_fuzzy_dot"] = dot
+            st.session_state["last_fuzzy_inputs"] = inputs
+        st.graphviz_chart(dot)
+        if violations:
+            for v in violations:
+                st.warning(f"Rule Violation: {v}")
+        else:
+            st.success("This is a valid fuzzy graph!")
 
 def render_fuzzy_graph_theory():
     """Renders the educational section on Fuzzy Graph Theory."""
-    st.header("1. Fuzzy Graph Theory: An Introduction")
     st.markdown("""
+    ## 1. Fuzzy Graph Theory: An Introduction
+
     A **fuzzy graph** is a powerful extension of a classical (or 'crisp') graph. In the real world, relationships and entities are often not black and white. A fuzzy graph allows us to model this uncertainty and ambiguity by representing connections and nodes with degrees of existence, rather than a simple 'yes' or 'no'.
-    """)
 
-    st.subheader("From Crisp to Fuzzy Sets")
-    st.markdown("""
+    ### From Crisp to Fuzzy Sets
+
     To understand fuzzy graphs, you must first understand the journey from classical sets to fuzzy sets.
     - **Crisp Set:** In classical math, an item is either IN a set or OUT of it. There's no middle ground. For the set of "Even Numbers," 4 has a membership of 1 (it's in), and 3 has a membership of 0 (it's out).
     - **Fuzzy Set:** Proposed by Lotfi Zadeh in 1965, a fuzzy set allows for **partial membership**. An element can belong to a set to a certain degree, measured from 0 to 1.
     """)
 
     st.info("Interactive Demo: The Fuzzy Set of 'Tall People'")
-    height = st.slider("Select a person's height (in cm):", 140, 220, 175)
+    height = st.slider("Select a person's height (in cm):", 140, 220, 175, key="height")
     
-    # Simple sigmoid-like function to determine membership in "tall"
-    if height < 160:
-        membership = 0.0
-    elif height < 180:
-        membership = (height - 160) / 20.0 * 0.8 # Scale up to 0.8
-    elif height < 190:
-        membership = 0.8 + ((height - 180) / 10.0 * 0.2) # Scale from 0.8 to 1.0
-    else:
-        membership = 1.0
+    # Simple sigmoid-like function to determine membership in "tall": 0 below 160 cm,
+    # rising to 0.8 at 180 cm and 1.0 at 190 cm
+    membership = float(np.interp(height, _TALL_X, _TALL_Y))
     st.write(f"A person with a height of **{height} cm** has a membership value of **{membership:.2f}** in the fuzzy set of 'Tall People'.")
     st.progress(membership)
+    st.line_chart(_tall_membership_curve(), x="Height (cm)", y="Membership")
 
-    st.subheader("Core Concepts of a Fuzzy Graph")
     st.markdown("""
+    ### Core Concepts of a Fuzzy Graph
+
     A fuzzy graph is formally defined as a pair $\\tilde{G} = (\\sigma, \\mu)$, consisting of a fuzzy vertex set and a fuzzy edge set.
 
     - **Fuzzy Vertex Set ($\\sigma$):** A function that assigns a membership value to each vertex. This value, $\\sigma(v)$, represents the degree to which the vertex *exists*. A value of 1 means it fully exists.
@@ -70,47 +178,7 @@ def render_fuzzy_graph_theory():
     st.markdown("The strength of an edge can never exceed the strength of the vertices it connects. This makes intuitive sense—a relationship can't be stronger than the entities it links.")
     st.latex(r"\mu(u, v) \le \min(\sigma(u), \sigma(v))")
 
-    st.info("Interactive Demo: Build Your Own Fuzzy Graph!")
-    col1, col2 = st.columns([1, 1.5])
-    with col1:
-        st.write("Adjust Vertex & Edge Values:")
-        sigma_a = st.slider("Vertex A Existence (σ)", 0.0, 1.0, 0.9, 0.05)
-        sigma_b = st.slider("Vertex B Existence (σ)", 0.0, 1.0, 0.8, 0.05)
-        sigma_c = st.slider("Vertex C Existence (σ)", 0.0, 1.0, 1.0, 0.05)
-        mu_ab = st.slider("Edge A-B Strength (μ)", 0.0, 1.0, 0.7, 0.05)
-        mu_bc = st.slider("Edge B-C Strength (μ)", 0.0, 1.0, 0.6, 0.05)
-        mu_ac = st.slider("Edge A-C Strength (μ)", 0.0, 1.0, 0.5, 0.05)
-    
-    # Check the golden rule
-    violations = []
-    if mu_ab > min(sigma_a, sigma_b):
-        violations.append(f"Edge A-B ({mu_ab:.2f}) is stronger than min(A, B) = {min(sigma_a, sigma_b):.2f}")
-    if mu_bc > min(sigma_b, sigma_c):
-        violations.append(f"Edge B-C ({mu_bc:.2f}) is stronger than min(B, C) = {min(sigma_b, sigma_c):.2f}")
-    if mu_ac > min(sigma_a, sigma_c):
-        violations.append(f"Edge A-C ({mu_ac:.2f}) is stronger than min(A, C) = {min(sigma_a, sigma_c):.2f}")
-
-    with col2:
-        st.write("Generated Fuzzy Graph:")
-        if GRAPHVIZ_INSTALLED:
-            # Create Graphviz graph
-            dot = graphviz.Graph()
-            dot.attr('node', shape='circle', style='filled', fillcolor='lightblue', fontcolor='black')
-            dot.attr('edge', fontcolor='darkgreen')
-            dot.node('A', f"A (σ={sigma_a:.2f})")
-            dot.node('B', f"B (σ={sigma_b:.2f})")
-            dot.node('C', f"C (σ={sigma_c:.2f})")
-            dot.edge('A', 'B', label=f"μ={mu_ab:.2f}")
-            dot.edge('B', 'C', label=f"μ={mu_bc:.2f}")
-            dot.edge('A', 'C', label=f"μ={mu_ac:.2f}")
-            st.graphviz_chart(dot)
-            if violations:
-                for v in violations:
-                    st.warning(f"Rule Violation: {v}")
-            else:
-                st.success("This is a valid fuzzy graph!")
-        else:
-            display_graphviz_installation_instructions()
+    _render_fuzzy_graph_demo()
 
     st.subheader("Key Terminology and Operations")
     with st.expander("Path, Strength, and Connectivity"):
@@ -135,8 +203,9 @@ def render_fuzzy_graph_theory():
     with tab3:
         st.markdown("A **bipolar fuzzy graph** is an extension where edge values can range from -1 to 1. Positive values indicate connection/agreement, while negative values indicate repulsion/disagreement, modeling more complex relationships.")
     
-    st.subheader("Applications of Fuzzy Graph Theory 🗺️")
     st.markdown("""
+    ### Applications of Fuzzy Graph Theory 🗺️
+
     -  socials **Social Network Analysis:** Modeling friendships or influence with varying degrees of strength.
     - decision **Decision Making:** Finding the most reliable (not necessarily shortest) path in a network, like transportation or data routing.
     - image **Image Processing:** Representing fuzzy relationships between pixels or regions in an image based on color or texture.
@@ -144,10 +213,64 @@ def render_fuzzy_graph_theory():
     - bio **Chemistry and Biology:** Modeling interactions between proteins or chemical compounds where bond strengths can vary.
     """)
 
+@st.fragment
+def _render_pfmst_demo():
+    """Renders the PFMST clustering demo; its threshold slider only reruns this fragment."""
+    threshold = st.slider("Set Similarity Threshold (α)", 0.5, 0.9, 0.65, 0.01, key="threshold")
+    
+    st.write(f"By cutting all connections weaker than **{threshold:.2f}**, the cars separate into distinct clusters.")
+
+    # Snap to the slider's 0.01 grid so both render paths cut the same edges
+    t = round(threshold, 2)
+    svgs = _pfmst_svgs()
+    if svgs:
+        st.image(svgs[t])
+    else:
+        # Without server-side Graphviz, let st.graphviz_chart lay the graph out in the browser
+        st.graphviz_chart(_build_mst(t))
+
+@st.fragment
+def _render_fs_tab():
+    """Renders the Fuzzy Set tab of the voting analogy."""
+    st.markdown("**Fuzzy Set (FS):** Handles one dimension: membership (e.g., support).")
+    support_fs = st.slider("Degree of Support (Yes)", 0.0, 1.0, 0.7, key="fs")
+    st.write(f"In this model, your opinion is simply a **{support_fs:.2f}** level of support.")
+
+@st.fragment
+def _render_ifs_tab():
+    """Renders the Intuitionistic Fuzzy Set tab of the voting analogy."""
+    st.markdown("**Intuitionistic Fuzzy Set (IFS):** Adds a second dimension: non-membership (e.g., opposition). The leftover is 'hesitation'.")
+    support_ifs = st.slider("Degree of Support (Yes)", 0.0, 1.0, 0.6, key="ifs_s")
+    oppose_ifs_max = 1.0 - support_ifs
+    oppose_ifs = st.slider("Degree of Opposition (No)", 0.0, oppose_ifs_max, 0.2, key="ifs_o")
+    hesitation = 1.0 - support_ifs - oppose_ifs
+    st.markdown(f"Support (Yes): **{support_ifs:.2f}**  \nOpposition (No): **{oppose_ifs:.2f}**")
+    st.info(f"Degree of Hesitation/Uncertainty: **{hesitation:.2f}**")
+
+@st.fragment
+def _render_pfs_tab():
+    """Renders the Picture Fuzzy Set tab of the voting analogy."""
+    st.markdown("""
+    **Picture Fuzzy Set (PFS):** The most expressive model. It adds a third dimension: neutrality (abstention). The leftover is 'refusal'. This is the focus of the paper.
+    """)
+    support_pfs = st.slider("Degree of Support (Yes)", 0.0, 1.0, 0.5, key="pfs_s")
+    oppose_pfs_max = 1.0 - support_pfs
+    oppose_pfs = st.slider("Degree of Opposition (No)", 0.0, oppose_pfs_max, 0.2, key="pfs_o")
+    abstain_pfs_max = 1.0 - support_pfs - oppose_pfs
+    abstain_pfs = st.slider("Degree of Abstention (Neutral)", 0.0, abstain_pfs_max, 0.1, key="pfs_a")
+    refusal = 1.0 - support_pfs - oppose_pfs - abstain_pfs
+    st.markdown(
+        f"Support (Yes): **{support_pfs:.2f}**  \n"
+        f"Opposition (No): **{oppose_pfs:.2f}**  \n"
+        f"Abstention (Neutral): **{abstain_pfs:.2f}**"
+    )
+    st.info(f"Degree of Refusal to Participate: **{refusal:.2f}**")
+
 def render_research_paper_summary():
     """Renders the summary of the Picture Fuzzy Sets research paper."""
-    st.header("2. Picture Fuzzy Similarity Measures (Research Paper Deep Dive)")
     st.markdown("""
+    ## 2. Picture Fuzzy Similarity Measures (Research Paper Deep Dive)
+
     This section breaks down the 2021 research paper by Surender Singh and Abdul Haseeb Ganie. The paper's goal is to fix critical flaws in how we measure similarity in **Picture Fuzzy Sets (PFS)** and apply these new, improved methods to real-world problems.
     """)
 
@@ -155,40 +278,22 @@ def render_research_paper_summary():
     **The Core Problem:** Existing methods for comparing Picture Fuzzy Sets are often unreliable. When comparing two objects that are *very similar but not identical*, many old formulas incorrectly calculate the similarity as **1.0000**, treating them as a perfect match. This is a major issue where small differences are critical.
     """)
 
-    st.subheader("The Evolution of Fuzzy Sets: An Interactive Analogy")
-    st.markdown("To understand the paper, we must understand why Picture Fuzzy Sets are so powerful. Let's use an interactive voting analogy.")
+    st.markdown("""
+    ### The Evolution of Fuzzy Sets: An Interactive Analogy
+
+    To understand the paper, we must understand why Picture Fuzzy Sets are so powerful. Let's use an interactive voting analogy.
+    """)
 
     tab_fs, tab_ifs, tab_pfs = st.tabs(["Fuzzy Set (FS)", "Intuitionistic Fuzzy Set (IFS)", "Picture Fuzzy Set (PFS)"])
 
     with tab_fs:
-        st.markdown("**Fuzzy Set (FS):** Handles one dimension: membership (e.g., support).")
-        support_fs = st.slider("Degree of Support (Yes)", 0.0, 1.0, 0.7, key="fs")
-        st.write(f"In this model, your opinion is simply a **{support_fs:.2f}** level of support.")
+        _render_fs_tab()
 
     with tab_ifs:
-        st.markdown("**Intuitionistic Fuzzy Set (IFS):** Adds a second dimension: non-membership (e.g., opposition). The leftover is 'hesitation'.")
-        support_ifs = st.slider("Degree of Support (Yes)", 0.0, 1.0, 0.6, key="ifs_s")
-        oppose_ifs_max = 1.0 - support_ifs
-        oppose_ifs = st.slider("Degree of Opposition (No)", 0.0, oppose_ifs_max, 0.2, key="ifs_o")
-        hesitation = 1.0 - support_ifs - oppose_ifs
-        st.write(f"Support (Yes): **{support_ifs:.2f}**")
-        st.write(f"Opposition (No): **{oppose_ifs:.2f}**")
-        st.info(f"Degree of Hesitation/Uncertainty: **{hesitation:.2f}**")
+        _render_ifs_tab()
 
     with tab_pfs:
-        st.markdown("""
-        **Picture Fuzzy Set (PFS):** The most expressive model. It adds a third dimension: neutrality (abstention). The leftover is 'refusal'. This is the focus of the paper.
-        """)
-        support_pfs = st.slider("Degree of Support (Yes)", 0.0, 1.0, 0.5, key="pfs_s")
-        oppose_pfs_max = 1.0 - support_pfs
-        oppose_pfs = st.slider("Degree of Opposition (No)", 0.0, oppose_pfs_max, 0.2, key="pfs_o")
-        abstain_pfs_max = 1.0 - support_pfs - oppose_pfs
-        abstain_pfs = st.slider("Degree of Abstention (Neutral)", 0.0, abstain_pfs_max, 0.1, key="pfs_a")
-        refusal = 1.0 - support_pfs - oppose_pfs - abstain_pfs
-        st.write(f"Support (Yes): **{support_pfs:.2f}**")
-        st.write(f"Opposition (No): **{oppose_pfs:.2f}**")
-        st.write(f"Abstention (Neutral): **{abstain_pfs:.2f}**")
-        st.info(f"Degree of Refusal to Participate: **{refusal:.2f}**")
+        _render_pfs_tab()
 
     st.subheader("The Paper's Main Contributions 🏆")
     st.success("""
@@ -218,33 +323,7 @@ def render_research_paper_summary():
         st.info("Interactive Demo: PFMST Clustering Concept")
         st.markdown("Imagine we have 10 cars and their similarity scores. The algorithm builds the strongest possible 'skeleton' connecting all cars (the MST). We can then form clusters by 'cutting' the weakest links.")
         
-        threshold = st.slider("Set Similarity Threshold (α)", 0.5, 0.9, 0.65, 0.01)
-        
-        st.write(f"By cutting all connections weaker than **{threshold:.2f}**, the cars separate into distinct clusters.")
-
-        if GRAPHVIZ_INSTALLED:
-            # Simplified MST from the paper's car example
-            mst_dot = graphviz.Graph(comment='Maximum Spanning Tree')
-            mst_dot.attr('node', shape='circle', style='filled', fillcolor='lightcoral')
-            
-            edges = {
-                ('G9', 'G4'): 0.87, ('G7', 'G2'): 0.83, ('G6', 'G1'): 0.82,
-                ('G7', 'G3'): 0.81, ('G7', 'G8'): 0.74, ('G10', 'G5'): 0.76,
-                ('G3', 'G9'): 0.64, ('G8', 'G10'): 0.69, ('G1', 'G4'): 0.64,
-            }
-
-            for (u, v), weight in edges.items():
-                if weight >= threshold:
-                    mst_dot.edge(u, v, label=f"{weight:.2f}")
-                else:
-                    # To show they exist but are cut, we ensure the nodes are still present
-                    mst_dot.node(u)
-                    mst_dot.node(v)
-
-            st.graphviz_chart(mst_dot)
-        else:
-            display_graphviz_installation_instructions()
-
+        _render_pfmst_demo()
 
     with app_tab3:
         st.markdown("""
@@ -261,7 +340,9 @@ st.set_page_config(page_title="Fuzzy Concepts Explorer", layout="wide")
 st.title("Interactive Guide to Fuzzy Graph Theory & Picture Fuzzy Sets")
 
 st.sidebar.title("Navigation")
-selection = st.sidebar.radio("Go to", ["Fuzzy Graph Theory", "Picture Fuzzy Similarity Measures (Research Paper)"])
+with st.sidebar.form("nav"):
+    selection = st.radio("Go to", ["Fuzzy Graph Theory", "Picture Fuzzy Similarity Measures (Research Paper)"])
+    st.form_submit_button("Go")
 
 if selection == "Fuzzy Graph Theory":
     render_fuzzy_graph_theory()